@@ -1,6 +1,12 @@
+import numpy as np
+import pandas as pd
 import streamlit as st
 from datetime import time
-from pawpal_system import Owner, Pet, Task, Scheduler
+from math import ceil
+from pawpal_system import Owner, Pet, Task, Scheduler, format_minutes
+
+PRIORITY_BADGE = {"high": "🔴", "medium": "🟡", "low": "🟢"}
+PRIORITY_LABELS = [f"{PRIORITY_BADGE[p]} {p}" for p in ("low", "medium", "high")]
 
 st.set_page_config(page_title="PawPal+", page_icon="🐾", layout="wide")
 
@@ -26,6 +32,252 @@ if "owner" not in st.session_state:
 if "selected_pet" not in st.session_state:
     st.session_state.selected_pet = None
 
+# Bumped on every pet/task mutation so a shown schedule can tell it is out of date
+if "owner_version" not in st.session_state:
+    st.session_state.owner_version = 0
+
+
+def hm(t):
+    """Format a time as HH:MM."""
+    return format_minutes(t.hour * 60 + t.minute)
+
+
+def build_schedule_frame(schedule):
+    """Build the detailed-schedule table, labelling time slots with the memoized HH:MM formatter."""
+    return pd.DataFrame({
+        "Time": [f"{format_minutes(s.start_minutes)}-{format_minutes(s.end_minutes)}" for s in schedule],
+        "Task": pd.array([s.task.name for s in schedule], dtype="string"),
+        "Duration (min)": np.fromiter((s.duration_minutes for s in schedule), dtype=np.int32, count=len(schedule)),
+        "Priority": pd.Categorical(
+            [s.task.priority.upper() for s in schedule], categories=["LOW", "MEDIUM", "HIGH"], ordered=True
+        ),
+        "Frequency": pd.Categorical([s.task.frequency for s in schedule]),
+    }).set_index("Time")
+
+
+def build_task_frame(tasks):
+    """Build the task table with categorical priority/frequency/status columns."""
+    return pd.DataFrame({
+        "Task": pd.array([t.name for t in tasks], dtype="string"),
+        "Priority": pd.Categorical(
+            [f"{PRIORITY_BADGE.get(t.priority, '○')} {t.priority}" for t in tasks],
+            categories=PRIORITY_LABELS, ordered=True
+        ),
+        "Duration (min)": np.fromiter((t.duration_minutes for t in tasks), dtype=np.int32, count=len(tasks)),
+        "Frequency": pd.Categorical([t.frequency for t in tasks]),
+        "Status": pd.Categorical(
+            ["✓ Done" if t.is_completed else "⏳ Pending" for t in tasks],
+            categories=["⏳ Pending", "✓ Done"]
+        ),
+    }).set_index("Task")
+
+
+def display_table_paginated(df, key, page_size=20):
+    """Render a DataFrame with st.table, sending at most page_size rows per rerun."""
+    if len(df) > page_size:
+        page = st.number_input(
+            "Page", min_value=1, max_value=ceil(len(df) / page_size), value=1, key=key
+        )
+        df = df.iloc[(page - 1) * page_size : page * page_size]
+    st.table(df)
+
+
+# ============================================================================
+# Fragments - Sections that rerun on their own when their widgets change
+# ============================================================================
+
+@st.fragment
+def render_pet_manager():
+    """Sidebar pet list and Add Pet inputs."""
+    st.subheader("🐾 Pets")
+    st.caption(f"Managing {len(st.session_state.owner.pets)} pet(s)")
+    
+    # Display existing pets
+    if st.session_state.owner.pets:
+        for pet in st.session_state.owner.pets:
+            col1, col2 = st.columns([3, 1])
+            with col1:
+                if st.button(f"📍 {pet.name} ({pet.species})", key=f"pet_{pet.id}"):
+                    st.session_state.selected_pet = pet
+                    st.rerun()
+            with col2:
+                if st.button("✕", key=f"delete_{pet.id}"):
+                    st.session_state.owner.remove_pet(pet)
+                    st.session_state.owner_version += 1
+                    st.session_state.selected_pet = None
+                    st.rerun()
+    else:
+        st.info("No pets yet. Add one below.")
+    
+    st.divider()
+    st.subheader("➕ Add New Pet")
+    
+    with st.form("add_pet_form", clear_on_submit=True):
+        new_pet_name = st.text_input("Pet name", key="new_pet_name")
+        new_pet_species = st.selectbox("Species", ["dog", "cat", "rabbit", "bird", "hamster", "other"], key="new_pet_species")
+        new_pet_age = st.number_input("Age (years)", min_value=0, max_value=30, value=1, key="new_pet_age")
+        new_pet_needs = st.text_area("Special needs (optional)", key="new_pet_needs")
+        submitted = st.form_submit_button("Add Pet", use_container_width=True)
+    
+    if submitted:
+        if new_pet_name.strip():
+            new_pet = Pet(
+                name=new_pet_name,
+                species=new_pet_species,
+                age=int(new_pet_age),
+                special_needs=new_pet_needs
+            )
+            st.session_state.owner.add_pet(new_pet)
+            st.session_state.owner_version += 1
+            st.session_state.selected_pet = new_pet
+            st.rerun()
+        else:
+            st.error("Please enter a pet name.")
+
+
+@st.fragment
+def render_task_manager(pet, daily_tasks):
+    """Complete, delete, or reopen a single task of the selected pet."""
+    task_names = list(dict.fromkeys(t.name for t in daily_tasks))
+    task_to_manage = st.selectbox("Select a task to manage:", task_names, key="task_manage_select")
+    task_to_manage_obj = pet.get_task_by_name(task_to_manage)
+    
+    if task_to_manage_obj:
+        col1, col2, col3 = st.columns(3)
+        with col1:
+            if st.button("✓ Mark Complete", key="mark_complete_btn"):
+                next_task = task_to_manage_obj.mark_complete()
+                st.session_state.owner_version += 1
+                if next_task:
+                    pet.add_task(next_task)
+                    st.success(f"✓ Marked '{task_to_manage}' complete! New recurring instance created.")
+                else:
+                    st.success(f"✓ Marked '{task_to_manage}' complete!")
+                st.rerun()
+        with col2:
+            if st.button("✕ Delete Task", key="delete_manage_btn"):
+                pet.remove_task(task_to_manage_obj)
+                st.session_state.owner_version += 1
+                st.success(f"Deleted '{task_to_manage}'")
+                st.rerun()
+        with col3:
+            if task_to_manage_obj.is_completed:
+                if st.button("↺ Mark Incomplete", key="mark_incomplete_btn"):
+                    task_to_manage_obj.mark_incomplete()
+                    st.session_state.owner_version += 1
+                    st.info(f"Marked '{task_to_manage}' as incomplete")
+                    st.rerun()
+
+
+def render_schedule(result, available_minutes):
+    """Render a generated schedule with its conflicts and analysis."""
+    schedule, schedule_summary, conflict_summary, feasible, high_priority_tasks = result
+    
+    if schedule:
+        st.success("✓ Schedule generated successfully!")
+        
+        # Display summary
+        st.write(schedule_summary)
+        
+        # Conflict detection
+        st.divider()
+        st.subheader("⚠️ Conflict Detection")
+        if "No scheduling conflicts" in conflict_summary:
+            st.success(conflict_summary)
+        else:
+            st.warning(conflict_summary)
+        
+        # One pass over the schedule for the analysis totals
+        total_scheduled = 0
+        scheduled_high_priority_ids = set()
+        for scheduled in schedule:
+            total_scheduled += scheduled.duration_minutes
+            if scheduled.task.priority == "high":
+                scheduled_high_priority_ids.add(id(scheduled.task))
+        
+        # Detailed schedule view
+        st.divider()
+        st.subheader("📅 Detailed Schedule")
+        display_table_paginated(build_schedule_frame(schedule), key="schedule_table_page")
+        
+        # Feasibility check
+        st.divider()
+        st.subheader("📊 Schedule Analysis")
+        col1, col2, col3 = st.columns(3)
+        with col1:
+            st.metric("Scheduled Time", f"{total_scheduled} min")
+        with col2:
+            st.metric("Available Time", f"{available_minutes} min")
+        with col3:
+            utilization = (total_scheduled / available_minutes * 100) if available_minutes > 0 else 0
+            st.metric("Utilization", f"{utilization:.1f}%")
+        
+        # Feasibility and high-priority task analysis
+        st.divider()
+        if feasible:
+            st.success("✓ Schedule is feasible - all high-priority tasks fit in your available time!")
+        else:
+            st.warning("⚠️ Not all high-priority tasks could be scheduled. Consider adjusting owner availability or removing low-priority tasks.")
+        
+        # High priority task summary
+        if high_priority_tasks:
+            st.info(f"**High-Priority Tasks**: {len(scheduled_high_priority_ids)}/{len(high_priority_tasks)} scheduled")
+            if len(scheduled_high_priority_ids) < len(high_priority_tasks):
+                missed = [t.name for t in high_priority_tasks if id(t) not in scheduled_high_priority_ids]
+                st.caption(f"Could not schedule: {', '.join(missed)}")
+    else:
+        st.warning("No tasks to schedule. Add tasks to your pets first.")
+
+
+@st.fragment
+def render_schedule_panel():
+    """Owner availability metrics, schedule generation, and analysis."""
+    st.divider()
+    st.subheader("📅 Generate Daily Schedule")
+    
+    # O(1) reads of the owner's cached daily totals
+    owner = st.session_state.owner
+    daily_minutes = owner.get_total_daily_task_minutes()
+    daily_task_count = len(owner.get_all_daily_tasks())
+    available_minutes = owner.get_total_available_minutes()
+    
+    col1, col2 = st.columns(2)
+    with col1:
+        available_hours = available_minutes // 60
+        available_mins = available_minutes % 60
+        st.metric(
+            "Owner Availability",
+            f"{hm(owner.availability_start)} - {hm(owner.availability_end)}",
+            f"{available_hours}h {available_mins}m"
+        )
+    with col2:
+        daily_hours = daily_minutes // 60
+        daily_mins = daily_minutes % 60
+        st.metric(
+            "Total Daily Tasks",
+            f"{daily_task_count} tasks",
+            f"{daily_hours}h {daily_mins}m"
+        )
+    
+    schedule_key = (
+        st.session_state.owner_version, owner.name, owner.availability_start, owner.availability_end
+    )
+    if st.button("🚀 Generate Schedule", use_container_width=True):
+        scheduler = Scheduler(owner)
+        schedule = scheduler.generate_schedule()
+        st.session_state.last_schedule = (
+            schedule,
+            scheduler.get_schedule_summary(),
+            scheduler.get_conflicts_summary(),
+            scheduler.is_schedule_feasible(),
+            owner.get_all_high_priority_tasks(),
+        )
+        st.session_state.last_schedule_key = schedule_key
+    
+    # Keep showing the last schedule until pets, tasks, or availability change
+    if st.session_state.get("last_schedule_key") == schedule_key:
+        render_schedule(st.session_state.last_schedule, available_minutes)
+
 
 # ============================================================================
 # Sidebar: Owner Information & Pet Management
@@ -83,45 +335,7 @@ with st.sidebar:
     
     st.divider()
     
-    st.subheader("🐾 Pets")
-    st.caption(f"Managing {len(st.session_state.owner.pets)} pet(s)")
-    
-    # Display existing pets
-    if st.session_state.owner.pets:
-        for pet in st.session_state.owner.pets:
-            col1, col2 = st.columns([3, 1])
-            with col1:
-                if st.button(f"📍 {pet.name} ({pet.species})", key=f"pet_{pet.name}"):
-                    st.session_state.selected_pet = pet
-            with col2:
-                if st.button("✕", key=f"delete_{pet.name}"):
-                    st.session_state.owner.pets.remove(pet)
-                    st.session_state.selected_pet = None
-                    st.rerun()
-    else:
-        st.info("No pets yet. Add one below.")
-    
-    st.divider()
-    st.subheader("➕ Add New Pet")
-    
-    new_pet_name = st.text_input("Pet name", key="new_pet_name")
-    new_pet_species = st.selectbox("Species", ["dog", "cat", "rabbit", "bird", "hamster", "other"], key="new_pet_species")
-    new_pet_age = st.number_input("Age (years)", min_value=0, max_value=30, value=1, key="new_pet_age")
-    new_pet_needs = st.text_area("Special needs (optional)", key="new_pet_needs")
-    
-    if st.button("Add Pet", key="add_pet_btn", use_container_width=True):
-        if new_pet_name.strip():
-            new_pet = Pet(
-                name=new_pet_name,
-                species=new_pet_species,
-                age=int(new_pet_age),
-                special_needs=new_pet_needs
-            )
-            st.session_state.owner.add_pet(new_pet)
-            st.session_state.selected_pet = new_pet
-            st.rerun()
-        else:
-            st.error("Please enter a pet name.")
+    render_pet_manager()
 
 
 # ============================================================================
@@ -132,20 +346,23 @@ if st.session_state.selected_pet is None:
     st.info("👈 Select a pet from the sidebar to get started, or add a new pet!")
     
     # Show overview
+    owner = st.session_state.owner
+    pet_count = len(owner.pets)
+    total_tasks = sum(len(pet.tasks) for pet in owner.pets)
+    total_minutes = owner.get_total_daily_task_minutes()
     col1, col2, col3 = st.columns(3)
     with col1:
-        st.metric("Pets", len(st.session_state.owner.pets))
+        st.metric("Pets", pet_count)
     with col2:
-        total_tasks = sum(len(pet.tasks) for pet in st.session_state.owner.pets)
         st.metric("Total Tasks", total_tasks)
     with col3:
-        total_minutes = st.session_state.owner.get_total_daily_task_minutes()
         hours = total_minutes // 60
         mins = total_minutes % 60
         st.metric("Daily Time", f"{hours}h {mins}m")
 
 else:
     pet = st.session_state.selected_pet
+    daily_tasks = pet.get_daily_tasks()
     
     st.subheader(f"🐾 {pet.name} ({pet.species})")
     st.caption(f"Age: {pet.age} years | Special needs: {pet.special_needs if pet.special_needs else 'None'}")
@@ -154,17 +371,19 @@ else:
     st.divider()
     st.subheader(f"📋 Tasks for {pet.name}")
     
-    col1, col2, col3, col4 = st.columns(4)
-    with col1:
-        task_name = st.text_input("Task name", placeholder="e.g., Morning walk", key="task_name")
-    with col2:
-        task_duration = st.number_input("Duration (min)", min_value=1, max_value=240, value=30, key="task_duration")
-    with col3:
-        task_priority = st.selectbox("Priority", ["low", "medium", "high"], index=2, key="task_priority")
-    with col4:
-        task_frequency = st.selectbox("Frequency", ["daily", "twice-daily", "weekly"], key="task_frequency")
+    with st.form("add_task_form", clear_on_submit=True):
+        col1, col2, col3, col4 = st.columns(4)
+        with col1:
+            task_name = st.text_input("Task name", placeholder="e.g., Morning walk", key="task_name")
+        with col2:
+            task_duration = st.number_input("Duration (min)", min_value=1, max_value=240, value=30, key="task_duration")
+        with col3:
+            task_priority = st.selectbox("Priority", ["low", "medium", "high"], index=2, key="task_priority")
+        with col4:
+            task_frequency = st.selectbox("Frequency", ["daily", "twice-daily", "weekly"], key="task_frequency")
+        task_submitted = st.form_submit_button("Add Task")
     
-    if st.button("Add Task", use_container_width=False):
+    if task_submitted:
         if task_name.strip():
             new_task = Task(
                 name=task_name,
@@ -174,6 +393,7 @@ else:
                 frequency=task_frequency
             )
             pet.add_task(new_task)
+            st.session_state.owner_version += 1
             st.rerun()
         else:
             st.error("Please enter a task name.")
@@ -191,32 +411,21 @@ else:
         
         if task_filter_mode == "All Tasks":
             # Show all tasks in a table format
-            display_tasks = pet.get_daily_tasks()
+            display_tasks = daily_tasks
         elif task_filter_mode == "By Priority":
             selected_priority = st.selectbox("Select Priority", ["high", "medium", "low"], key="priority_filter")
-            display_tasks = scheduler.filter_tasks_by_priority(pet.get_daily_tasks(), selected_priority)
+            display_tasks = scheduler.filter_tasks_by_priority(daily_tasks, selected_priority)
         elif task_filter_mode == "By Status":
             status_choice = st.radio("Completion Status", ["Incomplete", "Completed"], horizontal=True)
             completed = (status_choice == "Completed")
-            display_tasks = scheduler.filter_tasks_by_status(pet.get_daily_tasks(), completed=completed)
+            display_tasks = scheduler.filter_tasks_by_status(daily_tasks, completed=completed)
         else:  # Search
             search_query = st.text_input("🔍 Search tasks by name or description", key="task_search")
-            display_tasks = pet.search_tasks(search_query) if search_query else pet.get_daily_tasks()
+            display_tasks = pet.search_tasks(search_query) if search_query else daily_tasks
         
         # Display filtered/sorted tasks with better formatting
         if display_tasks:
-            task_df_data = []
-            for task in display_tasks:
-                priority_badge = {"high": "🔴", "medium": "🟡", "low": "🟢"}
-                task_df_data.append({
-                    "Task": task.name,
-                    "Priority": f"{priority_badge.get(task.priority, '○')} {task.priority}",
-                    "Duration": f"{task.duration_minutes} min",
-                    "Frequency": task.frequency,
-                    "Status": "✓ Done" if task.is_completed else "⏳ Pending"
-                })
-            
-            st.dataframe(task_df_data, use_container_width=True, hide_index=True)
+            display_table_paginated(build_task_frame(display_tasks), key="task_table_page")
             
             # Show sorting options
             with st.expander("📊 Sort Tasks", expanded=False):
@@ -240,122 +449,8 @@ else:
         st.subheader("➕ Manage Individual Tasks")
         
         if display_tasks:
-            task_to_manage = st.selectbox("Select a task to manage:", [t.name for t in pet.get_daily_tasks()], key="task_manage_select")
-            task_to_manage_obj = next((t for t in pet.get_daily_tasks() if t.name == task_to_manage), None)
-            
-            if task_to_manage_obj:
-                col1, col2, col3 = st.columns(3)
-                with col1:
-                    if st.button("✓ Mark Complete", key="mark_complete_btn"):
-                        next_task = task_to_manage_obj.mark_complete()
-                        if next_task:
-                            pet.add_task(next_task)
-                            st.success(f"✓ Marked '{task_to_manage}' complete! New recurring instance created.")
-                        else:
-                            st.success(f"✓ Marked '{task_to_manage}' complete!")
-                        st.rerun()
-                with col2:
-                    if st.button("✕ Delete Task", key="delete_manage_btn"):
-                        pet.tasks.remove(task_to_manage_obj)
-                        st.success(f"Deleted '{task_to_manage}'")
-                        st.rerun()
-                with col3:
-                    if task_to_manage_obj.is_completed:
-                        if st.button("↺ Mark Incomplete", key="mark_incomplete_btn"):
-                            task_to_manage_obj.mark_incomplete()
-                            st.info(f"Marked '{task_to_manage}' as incomplete")
-                            st.rerun()
+            render_task_manager(pet, daily_tasks)
     else:
         st.info(f"No tasks for {pet.name} yet. Add one above!")
     
-    # ========== Schedule Generation ==========
-    st.divider()
-    st.subheader("📅 Generate Daily Schedule")
-    
-    col1, col2 = st.columns(2)
-    with col1:
-        available_minutes = st.session_state.owner.get_total_available_minutes()
-        available_hours = available_minutes // 60
-        available_mins = available_minutes % 60
-        st.metric(
-            "Owner Availability",
-            f"{st.session_state.owner.availability_start.strftime('%H:%M')} - {st.session_state.owner.availability_end.strftime('%H:%M')}",
-            f"{available_hours}h {available_mins}m"
-        )
-    with col2:
-        daily_minutes = st.session_state.owner.get_total_daily_task_minutes()
-        daily_hours = daily_minutes // 60
-        daily_mins = daily_minutes % 60
-        st.metric(
-            "Total Daily Tasks",
-            f"{len(st.session_state.owner.get_all_daily_tasks())} tasks",
-            f"{daily_hours}h {daily_mins}m"
-        )
-    
-    if st.button("🚀 Generate Schedule", use_container_width=True):
-        scheduler = Scheduler(st.session_state.owner)
-        schedule = scheduler.generate_schedule()
-        
-        if schedule:
-            st.success("✓ Schedule generated successfully!")
-            
-            # Display summary
-            st.write(scheduler.get_schedule_summary())
-            
-            # Conflict detection
-            st.divider()
-            st.subheader("⚠️ Conflict Detection")
-            conflict_summary = scheduler.get_conflicts_summary()
-            if "No scheduling conflicts" in conflict_summary:
-                st.success(conflict_summary)
-            else:
-                st.warning(conflict_summary)
-            
-            # Detailed schedule view
-            st.divider()
-            st.subheader("📅 Detailed Schedule")
-            schedule_data = []
-            for scheduled_task in schedule:
-                end_time = scheduled_task.get_end_time()
-                schedule_data.append({
-                    "Time": f"{scheduled_task.scheduled_time.strftime('%H:%M')}-{end_time.strftime('%H:%M')}",
-                    "Task": scheduled_task.task.name,
-                    "Duration": f"{scheduled_task.duration_minutes} min",
-                    "Priority": scheduled_task.task.priority.upper(),
-                    "Frequency": scheduled_task.task.frequency
-                })
-            
-            st.dataframe(schedule_data, use_container_width=True, hide_index=True)
-            
-            # Feasibility check
-            st.divider()
-            st.subheader("📊 Schedule Analysis")
-            col1, col2, col3 = st.columns(3)
-            with col1:
-                total_scheduled = sum(st.duration_minutes for st in schedule)
-                st.metric("Scheduled Time", f"{total_scheduled} min")
-            with col2:
-                available_minutes = st.session_state.owner.get_total_available_minutes()
-                st.metric("Available Time", f"{available_minutes} min")
-            with col3:
-                utilization = (total_scheduled / available_minutes * 100) if available_minutes > 0 else 0
-                st.metric("Utilization", f"{utilization:.1f}%")
-            
-            # Feasibility and high-priority task analysis
-            st.divider()
-            if scheduler.is_schedule_feasible():
-                st.success("✓ Schedule is feasible - all high-priority tasks fit in your available time!")
-            else:
-                st.warning("⚠️ Not all high-priority tasks could be scheduled. Consider adjusting owner availability or removing low-priority tasks.")
-            
-            # High priority task summary
-            high_priority_tasks = st.session_state.owner.get_all_high_priority_tasks()
-            scheduled_high_priority = [st.task for st in schedule if st.task.priority == "high"]
-            
-            if high_priority_tasks:
-                st.info(f"**High-Priority Tasks**: {len(scheduled_high_priority)}/{len(high_priority_tasks)} scheduled")
-                if len(scheduled_high_priority) < len(high_priority_tasks):
-                    missed = [t.name for t in high_priority_tasks if t not in scheduled_high_priority]
-                    st.caption(f"Could not schedule: {', '.join(missed)}")
-        else:
-            st.warning("No tasks to schedule. Add tasks to your pets first.")
+    render_schedule_panel()
@@ -39,26 +39,28 @@ def demo_sorting_and_filtering():
     print(f"Pet: {dog.name} ({dog.species})")
     print(f"Total tasks added: {len(dog.tasks)}\n")
     
+    daily_tasks = dog.get_daily_tasks()
+    
     # Show unsorted tasks
     print("Original task order:")
-    for i, task in enumerate(dog.get_daily_tasks(), 1):
+    for i, task in enumerate(daily_tasks, 1):
         print(f"  {i}. {task.name:20} | {task.duration_minutes:3}min | {task.priority:6} priority")
     
     # Sort by priority
     scheduler = Scheduler(owner)
-    sorted_by_priority = scheduler.sort_tasks_by_priority(dog.get_daily_tasks())
+    sorted_by_priority = scheduler.sort_tasks_by_priority(daily_tasks)
     print("\nSorted by priority (HIGH → MEDIUM → LOW):")
     for i, task in enumerate(sorted_by_priority, 1):
         print(f"  {i}. {task.name:20} | {task.duration_minutes:3}min | {task.priority:6} priority")
     
     # Sort by duration (short first)
-    sorted_by_duration = scheduler.sort_tasks_by_duration(dog.get_daily_tasks(), ascending=True)
+    sorted_by_duration = scheduler.sort_tasks_by_duration(daily_tasks, ascending=True)
     print("\nSorted by duration (shortest first):")
     for i, task in enumerate(sorted_by_duration, 1):
         print(f"  {i}. {task.name:20} | {task.duration_minutes:3}min | {task.priority:6} priority")
     
     # Filter by priority
-    high_priority = scheduler.filter_tasks_by_priority(dog.get_daily_tasks(), "high")
+    high_priority = scheduler.filter_tasks_by_priority(daily_tasks, "high")
     print(f"\nHigh-priority tasks only ({len(high_priority)} found):")
     for task in high_priority:
         print(f"  • {task.name} ({task.duration_minutes} min)")
@@ -8,12 +8,53 @@ This module contains the core classes that make up the PawPal+ system:
 - Scheduler: Generates daily schedules based on tasks and constraints
 """
 
-from dataclasses import dataclass, field
+import sys
+import uuid
+from dataclasses import dataclass, field, replace
+from functools import lru_cache
+from operator import attrgetter
 from typing import List, Optional, Dict
 from datetime import datetime, time, timedelta
 
 
-@dataclass
+# Numeric priority for scheduling; unknown priorities count as medium
+_PRIORITY_RANK = {'high': 3, 'medium': 2, 'low': 1}.get
+
+# Sort keys shared by the scheduler
+_BY_PRIORITY = attrgetter('priority_rank')
+_BY_DURATION = attrgetter('duration_minutes')
+
+# Frequencies that put a task on today's schedule
+_DAILY_FREQUENCIES = frozenset({'daily', 'twice-daily', 'three-times-daily'})
+
+# Frequencies that roll over to a fresh task when completed
+_RECURRING_FREQUENCIES = _DAILY_FREQUENCIES | {'weekly'}
+
+
+def _new_id() -> str:
+    """Return a fresh unique identifier."""
+    return uuid.uuid4().hex
+
+
+def _to_minutes(t: time) -> int:
+    """Return a time of day as minutes since midnight."""
+    return t.hour * 60 + t.minute
+
+
+@lru_cache(maxsize=None)
+def _time_of_day(minutes: int) -> time:
+    """Return the (shared, immutable) time for a minute of the day."""
+    return time(minutes // 60, minutes % 60)
+
+
+@lru_cache(maxsize=2048)
+def format_minutes(minutes: int) -> str:
+    """Format minutes since midnight as HH:MM, wrapping past midnight."""
+    hours, minutes = divmod(minutes, 60)
+    return f"{hours % 24:02d}:{minutes:02d}"
+
+
+@dataclass(slots=True)
 class Task:
     """
     Represents a pet care task.
@@ -26,6 +67,8 @@ class Task:
         frequency (str): How often (e.g., 'daily', 'twice-daily', 'weekly')
         is_completed (bool): Whether the task has been done today
         created_date (datetime): When the task was created
+        priority_rank (int): Numeric priority (3/2/1), derived from priority on read
+        is_daily (bool): Whether the frequency is a daily one, derived from frequency on read
     """
     name: str
     description: str
@@ -35,15 +78,31 @@ class Task:
     is_completed: bool = False
     created_date: datetime = field(default_factory=datetime.now)
 
+    def __post_init__(self) -> None:
+        """Intern the priority and frequency labels."""
+        # Interned labels let == against other interned strings short-circuit on identity
+        if type(self.priority) is str:
+            self.priority = sys.intern(self.priority)
+        if type(self.frequency) is str:
+            self.frequency = sys.intern(self.frequency)
+
+    @property
+    def priority_rank(self) -> int:
+        """Numeric priority (3/2/1); unknown priorities count as medium."""
+        return _PRIORITY_RANK(self.priority, 2)
+
+    @property
+    def is_daily(self) -> bool:
+        """Whether the frequency puts this task on today's schedule."""
+        return self.frequency in _DAILY_FREQUENCIES
+
     def is_due_today(self) -> bool:
         """Determine if this task should be done today based on frequency."""
-        daily_frequencies = ['daily', 'twice-daily', 'three-times-daily']
-        return self.frequency in daily_frequencies
+        return self.is_daily
 
     def get_priority_score(self) -> int:
         """Convert priority string to numeric score for scheduling."""
-        priority_map = {'high': 3, 'medium': 2, 'low': 1}
-        return priority_map.get(self.priority, 2)
+        return self.priority_rank
 
     def mark_complete(self) -> Optional['Task']:
         """
@@ -55,28 +114,8 @@ class Task:
         self.is_completed = True
         
         # Auto-generate next recurring task if applicable
-        if self.frequency in ['daily', 'twice-daily', 'three-times-daily']:
-            next_task = Task(
-                name=self.name,
-                description=self.description,
-                duration_minutes=self.duration_minutes,
-                priority=self.priority,
-                frequency=self.frequency,
-                is_completed=False,
-                created_date=datetime.now()
-            )
-            return next_task
-        elif self.frequency == 'weekly':
-            next_task = Task(
-                name=self.name,
-                description=self.description,
-                duration_minutes=self.duration_minutes,
-                priority=self.priority,
-                frequency=self.frequency,
-                is_completed=False,
-                created_date=datetime.now()
-            )
-            return next_task
+        if self.frequency in _RECURRING_FREQUENCIES:
+            return replace(self, is_completed=False, created_date=datetime.now())
         
         return None
 
@@ -85,7 +124,7 @@ class Task:
         self.is_completed = False
 
 
-@dataclass
+@dataclass(slots=True)
 class Pet:
     """
     Represents a pet.
@@ -95,47 +134,145 @@ class Pet:
         species (str): Type of pet (dog, cat, rabbit, etc.)
         age (int): Age in years
         special_needs (str): Any special care requirements
-        tasks (List[Task]): List of care tasks for this pet
+        tasks (List[Task]): List of care tasks for this pet. Tasks appended or
+            removed directly are picked up; after replacing items or editing
+            a task in place, call invalidate_cache
+        id (str): Stable unique identifier (not used for equality)
     """
     name: str
     species: str
     age: int
     special_needs: str = ""
     tasks: List[Task] = field(default_factory=list)
+    id: str = field(default_factory=_new_id, repr=False, compare=False)
+    # Daily-task cache, cleared by invalidate_cache (called from add_task/remove_task)
+    # and rebuilt when len(tasks) no longer matches _daily_source_size;
+    # _version lets an Owner tell that its own aggregates are stale
+    _daily_cache: Optional[List[Task]] = field(default=None, init=False, repr=False, compare=False)
+    _daily_source_size: int = field(default=0, init=False, repr=False, compare=False)
+    _daily_minutes: int = field(default=0, init=False, repr=False, compare=False)
+    _daily_by_priority: Dict[str, List[Task]] = field(default_factory=dict, init=False, repr=False, compare=False)
+    # Name -> first daily task with that name, built on the first lookup
+    _daily_by_name: Optional[Dict[str, Task]] = field(default=None, init=False, repr=False, compare=False)
+    # Lowercased "name\x00description" per daily task, built on the first search
+    _search_keys: Optional[List[str]] = field(default=None, init=False, repr=False, compare=False)
+    # Trigram -> indexes of the search keys containing it, built on the first 3+ character search
+    _search_trigrams: Optional[Dict[str, set]] = field(default=None, init=False, repr=False, compare=False)
+    _version: int = field(default=0, init=False, repr=False, compare=False)
+
+    def invalidate_cache(self) -> None:
+        """
+        Drop cached task views.
+        
+        add_task and remove_task call this themselves; call it after editing
+        self.tasks directly or changing a task's name, description,
+        duration, priority, or frequency in place.
+        """
+        self._daily_cache = None
+        self._daily_by_name = None
+        self._search_keys = None
+        self._search_trigrams = None
+        self._version += 1
 
     def add_task(self, task: Task) -> None:
         """Add a task for this pet."""
         self.tasks.append(task)
+        self.invalidate_cache()
+
+    def remove_task(self, task: Task) -> None:
+        """Remove a task from this pet (matched by identity, not equality)."""
+        for index, existing in enumerate(self.tasks):
+            if existing is task:
+                self.tasks.pop(index)
+                break
+        else:
+            raise ValueError(f"{task.name!r} is not one of {self.name}'s tasks")
+        self.invalidate_cache()
+
+    def get_task_by_name(self, name: str) -> Optional[Task]:
+        """Find a daily task by exact name; the first one added wins."""
+        daily_tasks = self._get_daily_cache()
+        if self._daily_by_name is None:
+            by_name = {}
+            for task in daily_tasks:
+                by_name.setdefault(task.name, task)
+            self._daily_by_name = by_name
+        return self._daily_by_name.get(name)
 
     def get_daily_tasks(self) -> List[Task]:
-        """Return all tasks that should happen today."""
-        return [task for task in self.tasks if task.is_due_today()]
+        """Return all tasks that should happen today, as a new list."""
+        return list(self._get_daily_cache())
+
+    def _get_daily_cache(self) -> List[Task]:
+        """Return the shared daily-task list, rebuilding it and its totals if stale."""
+        if self._daily_cache is not None and self._daily_source_size != len(self.tasks):
+            self.invalidate_cache()  # tasks was appended to or removed from directly
+        if self._daily_cache is None:
+            daily_tasks = []
+            by_priority = {}
+            total_minutes = 0
+            for task in self.tasks:
+                if task.is_daily:
+                    daily_tasks.append(task)
+                    by_priority.setdefault(task.priority, []).append(task)
+                    total_minutes += task.duration_minutes
+            self._daily_cache = daily_tasks
+            self._daily_source_size = len(self.tasks)
+            self._daily_by_priority = by_priority
+            self._daily_minutes = total_minutes
+        return self._daily_cache
 
     def get_total_task_duration(self) -> int:
         """Sum the duration of all daily tasks in minutes."""
-        return sum(task.duration_minutes for task in self.get_daily_tasks())
+        self._get_daily_cache()
+        return self._daily_minutes
 
     def get_incomplete_tasks(self) -> List[Task]:
         """Return all daily tasks that haven't been completed yet."""
-        return [task for task in self.get_daily_tasks() if not task.is_completed]
+        return [task for task in self._get_daily_cache() if not task.is_completed]
 
     def get_tasks_by_priority(self, priority: str) -> List[Task]:
         """Return all daily tasks with a specific priority level."""
-        return [task for task in self.get_daily_tasks() if task.priority == priority]
+        self._get_daily_cache()
+        return list(self._daily_by_priority.get(priority, ()))
 
     def get_tasks_by_status(self, completed: bool) -> List[Task]:
         """Return all daily tasks filtered by completion status."""
-        return [task for task in self.get_daily_tasks() if task.is_completed == completed]
+        return [task for task in self._get_daily_cache() if task.is_completed == completed]
 
     def search_tasks(self, query: str) -> List[Task]:
         """Search for tasks by name or description (case-insensitive)."""
         query_lower = query.lower()
-        return [task for task in self.get_daily_tasks() 
-                if query_lower in task.name.lower() or 
-                   query_lower in task.description.lower()]
-
-
-@dataclass
+        daily_tasks = self._get_daily_cache()
+        if self._search_keys is None:
+            # The NUL separator keeps a query from matching across name and description
+            self._search_keys = [f"{task.name}\x00{task.description}".lower() for task in daily_tasks]
+        keys = self._search_keys
+        if len(query_lower) < 3:
+            return [task for task, key in zip(daily_tasks, keys) if query_lower in key]
+        
+        # Only keys holding every trigram of the query can contain it; confirm those
+        trigrams = self._get_search_trigrams()
+        candidates = None
+        for start in range(len(query_lower) - 2):
+            posting = trigrams.get(query_lower[start:start + 3])
+            if not posting:
+                return []
+            candidates = posting if candidates is None else candidates & posting
+        return [daily_tasks[index] for index in sorted(candidates) if query_lower in keys[index]]
+
+    def _get_search_trigrams(self) -> Dict[str, set]:
+        """Return the trigram index over the cached search keys, building it if needed."""
+        if self._search_trigrams is None:
+            trigrams = {}
+            for index, key in enumerate(self._search_keys):
+                for start in range(len(key) - 2):
+                    trigrams.setdefault(key[start:start + 3], set()).add(index)
+            self._search_trigrams = trigrams
+        return self._search_trigrams
+
+
+@dataclass(slots=True)
 class Owner:
     """
     Represents a pet owner.
@@ -145,62 +282,119 @@ class Owner:
         availability_start (time): When the owner's day starts (e.g., 8:00 AM)
         availability_end (time): When the owner's day ends (e.g., 10:00 PM)
         preferences (dict): Owner's preferences for scheduling
-        pets (List[Pet]): List of pets owned
+        pets (List[Pet]): List of pets owned; add and remove pets with
+            add_pet/remove_pet so get_pet_by_name's index stays current
     """
     name: str
     availability_start: time = field(default_factory=lambda: time(8, 0))
     availability_end: time = field(default_factory=lambda: time(22, 0))
     preferences: dict = field(default_factory=dict)
     pets: List[Pet] = field(default_factory=list)
+    # All pets' daily tasks and their total minutes, keyed on each pet's id, task-list version, and task count
+    _daily_cache_key: Optional[tuple] = field(default=None, init=False, repr=False, compare=False)
+    _daily_cache: List[Task] = field(default_factory=list, init=False, repr=False, compare=False)
+    _daily_minutes: int = field(default=0, init=False, repr=False, compare=False)
+    # Pets keyed by casefolded name (first match wins); _pet_names holds each pet's
+    # name when the index was built, or None once add_pet/remove_pet have made it stale
+    _pets_by_name: Dict[str, Pet] = field(default_factory=dict, init=False, repr=False, compare=False)
+    _pet_names: Optional[List[str]] = field(default=None, init=False, repr=False, compare=False)
 
     def add_pet(self, pet: Pet) -> None:
         """Add a pet to the owner's list."""
         self.pets.append(pet)
+        self._pet_names = None
+
+    def remove_pet(self, pet: Pet) -> None:
+        """Remove a pet from the owner's list (matched by identity, not equality)."""
+        for index, existing in enumerate(self.pets):
+            if existing is pet:
+                self.pets.pop(index)
+                break
+        else:
+            raise ValueError(f"{pet.name!r} is not one of {self.name}'s pets")
+        self._pet_names = None
+
+    def _index_pets(self) -> None:
+        """Rebuild the casefolded-name index over the current pet list."""
+        index = {}
+        for pet in self.pets:
+            index.setdefault(pet.name.casefold(), pet)
+        self._pets_by_name = index
+        self._pet_names = [pet.name for pet in self.pets]
 
     def get_total_available_minutes(self) -> int:
         """Calculate total minutes available in a day."""
-        start_minutes = self.availability_start.hour * 60 + self.availability_start.minute
-        end_minutes = self.availability_end.hour * 60 + self.availability_end.minute
-        return end_minutes - start_minutes
+        return self._minutes_between(self.availability_start, self.availability_end)
+
+    @staticmethod
+    @lru_cache(maxsize=8)
+    def _minutes_between(start: time, end: time) -> int:
+        """Minutes from start to end, memoized on the (start, end) pair."""
+        return _to_minutes(end) - _to_minutes(start)
 
     def update_preferences(self, new_preferences: dict) -> None:
         """Update scheduling preferences."""
         self.preferences.update(new_preferences)
 
     def get_all_daily_tasks(self) -> List[Task]:
-        """Retrieve all daily tasks from all pets."""
-        all_tasks = []
-        for pet in self.pets:
-            all_tasks.extend(pet.get_daily_tasks())
-        return all_tasks
+        """Retrieve all daily tasks from all pets, as a new list."""
+        return list(self._get_daily_cache())
+
+    def _get_daily_cache(self) -> List[Task]:
+        """
+        Return the shared list of all pets' daily tasks.
+        
+        Rebuilt only when a pet is added or removed or a pet's tasks change.
+        """
+        key = tuple((pet.id, pet._version, len(pet.tasks)) for pet in self.pets)
+        if key != self._daily_cache_key:
+            all_tasks = []
+            total_minutes = 0
+            for pet in self.pets:
+                all_tasks.extend(pet._get_daily_cache())
+                total_minutes += pet.get_total_task_duration()
+            self._daily_cache = all_tasks
+            self._daily_minutes = total_minutes
+            self._daily_cache_key = key
+        return self._daily_cache
 
     def get_total_daily_task_minutes(self) -> int:
         """Sum the duration of all daily tasks across all pets."""
-        return sum(pet.get_total_task_duration() for pet in self.pets)
+        # Totalled alongside the cached daily task list
+        self._get_daily_cache()
+        return self._daily_minutes
 
     def get_pet_by_name(self, name: str) -> Optional[Pet]:
-        """Find a pet by name (case-insensitive)."""
-        name_lower = name.lower()
-        for pet in self.pets:
-            if pet.name.lower() == name_lower:
-                return pet
-        return None
+        """
+        Find a pet by name (case-insensitive).
+        
+        Pets renamed in place are still found. Pets swapped into self.pets
+        by item assignment are not tracked; use add_pet and remove_pet.
+        """
+        name_key = name.casefold()
+        if self._pet_names is None or len(self._pet_names) != len(self.pets):
+            self._index_pets()
+        pet = self._pets_by_name.get(name_key)
+        if pet is not None and pet.name.casefold() == name_key:
+            return pet
+        # Miss, or the indexed pet was renamed. Unchanged names (an identity-first
+        # list compare, no casefolding) make the miss final; otherwise re-index
+        if pet is None and [p.name for p in self.pets] == self._pet_names:
+            return None
+        self._index_pets()
+        return self._pets_by_name.get(name_key)
 
     def get_all_high_priority_tasks(self) -> List[Task]:
         """Get all high-priority daily tasks across all pets."""
-        high_priority = []
-        for pet in self.pets:
-            high_priority.extend(pet.get_tasks_by_priority('high'))
-        return high_priority
+        return [task for task in self._get_daily_cache() if task.priority == 'high']
 
     def get_incomplete_tasks_by_pet(self) -> Dict[str, List[Task]]:
         """Return a dictionary mapping pet names to their incomplete tasks."""
-        result = {}
-        for pet in self.pets:
-            incomplete = pet.get_tasks_by_status(False)
-            if incomplete:
-                result[pet.name] = incomplete
-        return result
+        return {
+            pet.name: incomplete
+            for pet in self.pets
+            if (incomplete := [task for task in pet._get_daily_cache() if not task.is_completed])
+        }
 
 
 class ScheduledTask:
@@ -211,35 +405,49 @@ class ScheduledTask:
         task (Task): The task being scheduled
         scheduled_time (time): When it should happen
         duration_minutes (int): How long it will take
+        start_minutes (int): scheduled_time as minutes since midnight
+        end_minutes (int): start_minutes + duration_minutes
     """
+    __slots__ = ('task', 'scheduled_time', 'duration_minutes', 'start_minutes', 'end_minutes')
+
     def __init__(self, task: Task, scheduled_time: time, duration_minutes: int):
         self.task = task
         self.scheduled_time = scheduled_time
         self.duration_minutes = duration_minutes
+        self.start_minutes = _to_minutes(scheduled_time)
+        self.end_minutes = self.start_minutes + duration_minutes
 
     def get_end_time(self) -> time:
         """Calculate when this task will finish."""
-        total_minutes = (self.scheduled_time.hour * 60 + 
-                        self.scheduled_time.minute + 
-                        self.duration_minutes)
-        hours = total_minutes // 60
-        minutes = total_minutes % 60
-        return time(hours % 24, minutes)
+        return _time_of_day(self.end_minutes % 1440)
 
     def overlaps_with(self, other: 'ScheduledTask') -> bool:
         """Check if this task overlaps with another."""
-        self_start = self.scheduled_time.hour * 60 + self.scheduled_time.minute
-        self_end = self_start + self.duration_minutes
-        
-        other_start = other.scheduled_time.hour * 60 + other.scheduled_time.minute
-        other_end = other_start + other.duration_minutes
-        
-        return not (self_end <= other_start or other_end <= self_start)
+        return self.end_minutes > other.start_minutes and other.end_minutes > self.start_minutes
 
     def __str__(self) -> str:
         """Return a readable string representation."""
-        end_time = self.get_end_time()
-        return f"{self.scheduled_time.strftime('%H:%M')}-{end_time.strftime('%H:%M')}: {self.task.name} ({self.duration_minutes} min)"
+        return (f"{format_minutes(self.start_minutes)}-{format_minutes(self.end_minutes)}: "
+                f"{self.task.name} ({self.duration_minutes} min)")
+
+
+def _pack_durations(durations: List[int], start: int, end: int) -> List[int]:
+    """
+    Greedily place durations back to back from start, skipping any that would run past end.
+    
+    Works purely on minute integers. Returns the start minute of each
+    duration in input order, or -1 for durations that did not fit.
+    """
+    starts = []
+    append = starts.append  # bound once; the loop then touches only locals
+    cursor = start
+    for duration in durations:
+        if cursor + duration <= end:
+            append(cursor)
+            cursor += duration
+        else:
+            append(-1)
+    return starts
 
 
 class Scheduler:
@@ -258,51 +466,57 @@ class Scheduler:
         self.owner = owner
         self.schedule: List[ScheduledTask] = []
 
+    def add_scheduled_task(self, scheduled: ScheduledTask) -> None:
+        """Append a task to the schedule."""
+        self.schedule.append(scheduled)
+
     def generate_schedule(self) -> List[ScheduledTask]:
         """
         Create a daily schedule for all pets.
         
-        Sorts tasks by priority (high first), then fits them into available time slots
-        starting from the owner's availability start time.
+        Orders tasks by priority (high first) and, within each priority, by
+        duration (shortest first), then fits them back to back into available
+        time slots starting from the owner's availability start time. Taking
+        the shortest tasks first fits the most tasks of each priority.
         
         Returns:
             A list of ScheduledTask objects representing today's plan.
         """
-        # Get all daily tasks and sort by priority (descending)
-        all_tasks = self.owner.get_all_daily_tasks()
-        all_tasks.sort(key=lambda t: t.get_priority_score(), reverse=True)
-        
-        self.schedule = []
-        current_time = self.owner.availability_start
+        # Group daily tasks by priority rank (only 1-3) in one pass, then take
+        # each group shortest first; the sort is stable, so ties keep their order
+        buckets = ([], [], [], [])
+        for task in self.owner._get_daily_cache():
+            buckets[task.priority_rank].append(task)
+        all_tasks = []
+        for rank in (3, 2, 1):
+            all_tasks.extend(sorted(buckets[rank], key=_BY_DURATION))
         
-        for task in all_tasks:
-            # Check if task fits before owner's availability ends
-            task_end_minutes = (current_time.hour * 60 + current_time.minute + task.duration_minutes)
-            availability_end_minutes = (self.owner.availability_end.hour * 60 + 
-                                       self.owner.availability_end.minute)
-            
-            if task_end_minutes <= availability_end_minutes:
-                scheduled = ScheduledTask(task, current_time, task.duration_minutes)
-                self.schedule.append(scheduled)
-                # Update current time for next task
-                current_time = scheduled.get_end_time()
+        start_minutes = _pack_durations(
+            [task.duration_minutes for task in all_tasks],
+            _to_minutes(self.owner.availability_start),
+            _to_minutes(self.owner.availability_end),
+        )
         
+        # Only tasks that fit get a ScheduledTask
+        self.schedule = [
+            ScheduledTask(task, _time_of_day(start), task.duration_minutes)
+            for task, start in zip(all_tasks, start_minutes)
+            if start >= 0
+        ]
         return self.schedule
 
     def can_fit_task(self, task: Task, proposed_time: time) -> bool:
         """Check if a task can fit at a proposed time without conflicts."""
-        proposed_minutes = proposed_time.hour * 60 + proposed_time.minute
+        proposed_minutes = _to_minutes(proposed_time)
         task_end_minutes = proposed_minutes + task.duration_minutes
-        availability_end_minutes = (self.owner.availability_end.hour * 60 + 
-                                   self.owner.availability_end.minute)
         
-        if task_end_minutes > availability_end_minutes:
+        if task_end_minutes > _to_minutes(self.owner.availability_end):
             return False
         
-        # Check for overlaps with existing scheduled tasks
+        # Scan the live schedule so any edit to the list is seen; one pass of
+        # integer compares, with no index to keep in step
         for scheduled in self.schedule:
-            test_scheduled = ScheduledTask(task, proposed_time, task.duration_minutes)
-            if test_scheduled.overlaps_with(scheduled):
+            if scheduled.start_minutes < task_end_minutes and scheduled.end_minutes > proposed_minutes:
                 return False
         
         return True
@@ -312,39 +526,41 @@ class Scheduler:
         if not self.schedule:
             return "No tasks scheduled for today."
         
-        summary = f"Today's Schedule for {self.owner.name}:\n"
-        summary += "-" * 50 + "\n"
-        for scheduled_task in self.schedule:
-            summary += f"  {scheduled_task}\n"
-        summary += "-" * 50 + "\n"
+        lines = [f"Today's Schedule for {self.owner.name}:", "-" * 50]
+        lines.extend(f"  {scheduled_task}" for scheduled_task in self.schedule)
+        lines.append("-" * 50)
         
-        total_minutes = sum(st.duration_minutes for st in self.schedule)
-        summary += f"Total time: {total_minutes} minutes ({total_minutes // 60}h {total_minutes % 60}m)"
+        total_minutes = sum(scheduled.duration_minutes for scheduled in self.schedule)
+        lines.append(f"Total time: {total_minutes} minutes ({total_minutes // 60}h {total_minutes % 60}m)")
         
-        return summary
+        return "\n".join(lines)
 
     def is_schedule_feasible(self) -> bool:
         """Verify that all critical tasks fit within available time."""
+        available_time = self.owner.get_total_available_minutes()
         total_time_needed = 0
-        critical_tasks = [t for t in self.owner.get_all_daily_tasks() 
-                         if t.priority == 'high']
         
-        for task in critical_tasks:
-            total_time_needed += task.duration_minutes
+        for task in self.owner._get_daily_cache():
+            if task.priority == 'high':
+                total_time_needed += task.duration_minutes
+                # Stop as soon as the budget is blown
+                if total_time_needed > available_time:
+                    return False
         
-        available_time = self.owner.get_total_available_minutes()
         return total_time_needed <= available_time
 
     def sort_tasks_by_priority(self, tasks: List[Task]) -> List[Task]:
         """Sort tasks by priority (high → medium → low)."""
-        return sorted(tasks, key=lambda t: t.get_priority_score(), reverse=True)
+        return sorted(tasks, key=_BY_PRIORITY, reverse=True)
 
     def sort_tasks_by_duration(self, tasks: List[Task], ascending: bool = False) -> List[Task]:
         """Sort tasks by duration in ascending order (short first) or descending."""
-        return sorted(tasks, key=lambda t: t.duration_minutes, reverse=not ascending)
+        return sorted(tasks, key=_BY_DURATION, reverse=not ascending)
 
     def filter_tasks_by_priority(self, tasks: List[Task], priority: str) -> List[Task]:
         """Filter tasks to only those with a specific priority level."""
+        if type(priority) is str:
+            priority = sys.intern(priority)
         return [task for task in tasks if task.priority == priority]
 
     def filter_tasks_by_status(self, tasks: List[Task], completed: bool = False) -> List[Task]:
@@ -361,23 +577,58 @@ class Scheduler:
         """
         conflicts = {}
         
-        for i, task1 in enumerate(self.schedule):
-            for j, task2 in enumerate(self.schedule):
-                if i < j and task1.overlaps_with(task2):
-                    conflict_key = f"{task1.task.name} vs {task2.task.name}"
-                    task1_end = task1.get_end_time()
-                    task2_end = task2.get_end_time()
-                    
-                    message = (
-                        f"⚠️ CONFLICT DETECTED: '{task1.task.name}' "
-                        f"({task1.scheduled_time.strftime('%H:%M')}-{task1_end.strftime('%H:%M')}) "
-                        f"overlaps with '{task2.task.name}' "
-                        f"({task2.scheduled_time.strftime('%H:%M')}-{task2_end.strftime('%H:%M')})"
-                    )
-                    conflicts[conflict_key] = message
+        for i, j in self._find_conflict_pairs():
+            task1 = self.schedule[i]
+            task2 = self.schedule[j]
+            conflict_key = f"{task1.task.name} vs {task2.task.name}"
+            
+            message = (
+                f"⚠️ CONFLICT DETECTED: '{task1.task.name}' "
+                f"({format_minutes(task1.start_minutes)}-{format_minutes(task1.end_minutes)}) "
+                f"overlaps with '{task2.task.name}' "
+                f"({format_minutes(task2.start_minutes)}-{format_minutes(task2.end_minutes)})"
+            )
+            conflicts[conflict_key] = message
         
         return conflicts
 
+    def _find_conflict_pairs(self) -> List[tuple]:
+        """
+        Return index pairs (i, j), i < j, of overlapping scheduled tasks.
+        
+        Sweeps the tasks in start order: each task is only compared with the
+        tasks that start before it ends, so the cost is O(n log n + k) for k
+        overlapping pairs instead of comparing every pair. Pairs come back in
+        schedule order, matching a plain nested loop.
+        
+        Each task's start minute and schedule index are packed into one int
+        (start << shift | index), so the sort compares plain ints with no key
+        function and ties on start keep schedule order.
+        """
+        schedule = self.schedule
+        count = len(schedule)
+        shift = count.bit_length()
+        mask = (1 << shift) - 1
+        packed = sorted((scheduled.start_minutes << shift) | index
+                        for index, scheduled in enumerate(schedule))
+        order = [key & mask for key in packed]
+        starts = [key >> shift for key in packed]
+        ends = [schedule[index].end_minutes for index in order]
+        
+        pairs = []
+        for position in range(count):
+            start, end, i = starts[position], ends[position], order[position]
+            for next_position in range(position + 1, count):
+                # Later tasks start no earlier, so once one starts at or after
+                # this end none of the rest can overlap
+                if starts[next_position] >= end:
+                    break
+                if ends[next_position] > start:
+                    j = order[next_position]
+                    pairs.append((i, j) if i < j else (j, i))
+        pairs.sort()
+        return pairs
+
     def get_conflicts_summary(self) -> str:
         """Return a formatted summary of any detected conflicts."""
         conflicts = self.detect_conflicts()
@@ -385,7 +636,6 @@ class Scheduler:
         if not conflicts:
             return "✓ No scheduling conflicts detected."
         
-        summary = f"Found {len(conflicts)} scheduling conflict(s):\n"
-        for message in conflicts.values():
-            summary += f"  {message}\n"
-        return summary
+        lines = [f"Found {len(conflicts)} scheduling conflict(s):"]
+        lines.extend(f"  {message}" for message in conflicts.values())
+        return "\n".join(lines) + "\n"
@@ -7,113 +7,120 @@ including basic operations, scheduling, and advanced algorithmic features.
 
 import pytest
 from pawpal_system import Owner, Pet, Task, Scheduler, ScheduledTask
-from datetime import time
+from datetime import datetime, time
 
 
-class TestTask:
-    """Test cases for the Task class."""
-    
-    def test_mark_complete(self):
-        """Verify that marking a task complete actually changes its status."""
-        task = Task(
-            name="Morning Walk",
-            description="Walk Max",
-            duration_minutes=30,
-            priority="high",
-            frequency="daily"
-        )
-        
-        # Initially, task should not be completed
-        assert task.is_completed == False
-        
-        # Mark it complete
-        task.mark_complete()
-        
-        # Now it should be completed
-        assert task.is_completed == True
+# Name, minutes, and priority of the daily tasks built by the daily_pet fixture
+DAILY_TASKS = (("Walk", 30, "high"), ("Feed", 10, "high"), ("Play", 20, "medium"))
+TOTAL_DAILY = sum(minutes for _, minutes, _ in DAILY_TASKS)
 
-    def test_mark_incomplete(self):
-        """Verify that marking a task incomplete changes its status."""
-        task = Task(
-            name="Feed Cat",
-            description="Feed Whiskers",
-            duration_minutes=10,
-            priority="high",
-            frequency="daily",
-            is_completed=True
-        )
-        
-        # Task starts as completed
-        assert task.is_completed == True
-        
-        # Mark it incomplete
-        task.mark_incomplete()
-        
-        # Now it should not be completed
-        assert task.is_completed == False
+# The owner fixture's 8 AM to 6 PM window
+AVAILABLE_MINUTES = 600
 
-    def test_is_due_today(self):
-        """Verify that daily frequency tasks are recognized as due today."""
-        daily_task = Task(
-            name="Daily Task",
-            description="Should be due today",
-            duration_minutes=10,
-            priority="medium",
-            frequency="daily"
-        )
-        
-        assert daily_task.is_due_today() == True
 
-    def test_not_due_today(self):
-        """Verify that weekly tasks are not marked as daily due."""
-        weekly_task = Task(
-            name="Weekly Task",
-            description="Not due today",
-            duration_minutes=20,
-            priority="medium",
-            frequency="weekly"
-        )
-        
-        assert weekly_task.is_due_today() == False
+def make_task(name, minutes, priority="high", frequency="daily", description=None, **fields):
+    """Build a Task; the description defaults to the name."""
+    return Task(name, description or name, minutes, priority, frequency, **fields)
+
+
+# Read-only task prototypes shared across the module; tests must not mutate them
+@pytest.fixture(scope="module")
+def walk_task():
+    return make_task("Walk", 30)
 
-    def test_priority_score(self):
-        """Verify that priority strings map to correct numeric scores."""
-        high_priority = Task("High", "desc", 10, priority="high", frequency="daily")
-        medium_priority = Task("Medium", "desc", 10, priority="medium", frequency="daily")
-        low_priority = Task("Low", "desc", 10, priority="low", frequency="daily")
-        
-        assert high_priority.get_priority_score() == 3
-        assert medium_priority.get_priority_score() == 2
-        assert low_priority.get_priority_score() == 1
+
+@pytest.fixture(scope="module")
+def feed_task():
+    return make_task("Feed", 10)
+
+
+@pytest.fixture(scope="module")
+def bath_task():
+    return make_task("Bath", 45, "low", "weekly")
+
+
+# Fresh mutable objects for each test
+@pytest.fixture
+def pet():
+    return Pet("Max", "Dog", 3)
+
+
+@pytest.fixture
+def owner():
+    return Owner("Sarah", time(8, 0), time(18, 0))
+
+
+@pytest.fixture
+def daily_pet(pet):
+    for name, minutes, priority in DAILY_TASKS:
+        pet.add_task(make_task(name, minutes, priority))
+    return pet
+
+
+# Walk + Feed for one pet in an 8 AM to 6 PM window, scheduled once per module.
+# Tests must only read the returned scheduler, schedule, and feasibility flag.
+@pytest.fixture(scope="module")
+def feasible_scheduler(walk_task, feed_task):
+    owner = Owner("Sarah", time(8, 0), time(18, 0))
+    pet = Pet("Max", "Dog", 3)
+    pet.add_task(walk_task)
+    pet.add_task(feed_task)
+    owner.add_pet(pet)
+    scheduler = Scheduler(owner)
+    return scheduler, scheduler.generate_schedule(), scheduler.is_schedule_feasible()
+
+
+class TestTask:
+    """Test cases for the Task class."""
+    
+    @pytest.mark.parametrize("op, expected", [
+        ("mark_complete", True),
+        ("mark_incomplete", False),
+    ])
+    def test_task_toggle(self, op, expected):
+        """Verify that marking a task complete or incomplete flips its status."""
+        task = make_task("Task", 10, is_completed=not expected)
+        
+        getattr(task, op)()
+        
+        assert task.is_completed == expected
+
+    @pytest.mark.parametrize("frequency, expected", [
+        ("daily", True),
+        ("twice-daily", True),
+        ("three-times-daily", True),
+        ("weekly", False),
+        ("monthly", False),
+    ])
+    def test_is_due_today(self, frequency, expected):
+        """Verify that only daily frequencies are recognized as due today."""
+        task = make_task("Task", 10, "medium", frequency)
+        
+        assert task.is_due_today() == expected
+
+    @pytest.mark.parametrize("priority, score", [
+        ("high", 3),
+        ("medium", 2),
+        ("low", 1),
+        ("urgent", 2),
+    ])
+    def test_priority_score(self, priority, score):
+        """Verify that priority strings map to correct numeric scores (unknown counts as medium)."""
+        task = make_task("Task", 10, priority)
+        
+        assert task.get_priority_score() == score
 
 
 class TestPet:
     """Test cases for the Pet class."""
     
-    def test_add_task(self):
+    def test_add_task(self, pet, walk_task):
         """Verify that adding a task to a pet increases the task count."""
-        pet = Pet(
-            name="Max",
-            species="Dog",
-            age=3
-        )
-        
-        # Initially, no tasks
         assert len(pet.tasks) == 0
         
-        # Add a task
-        task = Task(
-            name="Walk",
-            description="Morning walk",
-            duration_minutes=30,
-            priority="high",
-            frequency="daily"
-        )
-        pet.add_task(task)
+        pet.add_task(walk_task)
         
-        # Now there should be one task
-        assert len(pet.tasks) == 1
-        assert pet.tasks[0].name == "Walk"
+        assert [t.name for t in pet.tasks] == ["Walk"]
 
     def test_add_multiple_tasks(self):
         """Verify that multiple tasks can be added and are all stored."""
@@ -123,9 +130,9 @@ class TestPet:
             age=5
         )
         
-        task1 = Task("Feed", "Feeding time", 10, "high", "daily")
-        task2 = Task("Play", "Playtime", 15, "medium", "daily")
-        task3 = Task("Groom", "Grooming", 20, "low", "weekly")
+        task1 = make_task("Feed", 10)
+        task2 = make_task("Play", 15, "medium")
+        task3 = make_task("Groom", 20, "low", "weekly")
         
         pet.add_task(task1)
         pet.add_task(task2)
@@ -133,77 +140,200 @@ class TestPet:
         
         assert len(pet.tasks) == 3
 
-    def test_get_daily_tasks(self):
+    def test_get_daily_tasks(self, pet, walk_task, bath_task):
         """Verify that only daily tasks are returned."""
-        pet = Pet(
-            name="Max",
-            species="Dog",
-            age=3
-        )
+        pet.add_task(walk_task)
+        pet.add_task(bath_task)
+        
+        assert [t.name for t in pet.get_daily_tasks()] == ["Walk"]
+
+    def test_get_daily_tasks_refreshes_after_changes(self):
+        """Verify that the cached daily task list follows add_task and remove_task."""
+        pet = Pet("Max", "Dog", 3)
+        walk = make_task("Walk", 30)
+        pet.add_task(walk)
+        assert pet.get_daily_tasks() == [walk]
+        
+        feed = make_task("Feed", 10)
+        pet.add_task(feed)
+        assert pet.get_daily_tasks() == [walk, feed]
+        
+        pet.remove_task(walk)
+        assert pet.get_daily_tasks() == [feed]
+
+    def test_get_daily_tasks_returns_copies(self, owner, daily_pet):
+        """Verify that editing a returned daily task list leaves the cached views intact."""
+        owner.add_pet(daily_pet)
+        
+        daily_pet.get_daily_tasks().clear()
+        owner.get_all_daily_tasks().sort(key=lambda t: t.duration_minutes)
+        
+        assert [t.name for t in daily_pet.get_daily_tasks()] == [name for name, _, _ in DAILY_TASKS]
+        assert [t.name for t in owner.get_all_daily_tasks()] == [name for name, _, _ in DAILY_TASKS]
+        assert owner.get_total_daily_task_minutes() == TOTAL_DAILY
+
+    def test_get_daily_tasks_after_direct_list_edits(self, owner):
+        """Verify that tasks appended to or removed from pet.tasks directly are picked up."""
+        pet = Pet("Max", "Dog", 3)
+        owner.add_pet(pet)
+        walk = make_task("Walk", 30)
+        pet.add_task(walk)
+        assert pet.get_total_task_duration() == 30
+        assert owner.get_total_daily_task_minutes() == 30
+        
+        feed = make_task("Feed", 10)
+        pet.tasks.append(feed)
         
-        daily_task = Task("Walk", "Walking", 30, "high", "daily")
-        weekly_task = Task("Bath", "Bathing", 45, "low", "weekly")
+        assert pet.get_daily_tasks() == [walk, feed]
+        assert pet.get_total_task_duration() == 40
+        assert pet.get_task_by_name("Feed") is feed
+        assert owner.get_total_daily_task_minutes() == 40
         
-        pet.add_task(daily_task)
-        pet.add_task(weekly_task)
+        pet.tasks.remove(walk)
         
-        daily_tasks = pet.get_daily_tasks()
-        assert len(daily_tasks) == 1
-        assert daily_tasks[0].name == "Walk"
+        assert pet.search_tasks("walk") == []
+        assert owner.get_all_daily_tasks() == [feed]
 
-    def test_get_total_task_duration(self):
+    def test_invalidate_cache_after_in_place_edit(self):
+        """Verify that invalidate_cache picks up tasks edited in place."""
+        pet = Pet("Max", "Dog", 3)
+        walk = make_task("Walk", 30)
+        pet.add_task(walk)
+        assert pet.get_total_task_duration() == 30
+        
+        walk.duration_minutes = 45
+        pet.tasks.append(make_task("Feed", 10))
+        pet.invalidate_cache()
+        
+        assert pet.get_total_task_duration() == 55
+        assert len(pet.get_daily_tasks()) == 2
+
+    def test_invalidate_cache_after_label_edit(self):
+        """Verify that priority and frequency edited in place reach the scheduler."""
+        owner = Owner("Sarah", time(8, 0), time(8, 30))
+        pet = Pet("Max", "Dog", 3)
+        walk = make_task("Walk", 30)
+        play = make_task("Play", 30, "low")
+        pet.add_task(walk)
+        pet.add_task(play)
+        pet.add_task(make_task("Feed", 10, "medium"))
+        owner.add_pet(pet)
+        
+        walk.priority, play.priority = play.priority, walk.priority
+        pet.get_task_by_name("Feed").frequency = "weekly"
+        pet.invalidate_cache()
+        
+        assert pet.get_tasks_by_priority("high") == [play]
+        assert [s.task.name for s in Scheduler(owner).generate_schedule()] == ["Play"]
+        assert [t.name for t in pet.get_daily_tasks()] == ["Walk", "Play"]
+
+    def test_get_total_task_duration(self, daily_pet):
         """Verify that task durations are summed correctly."""
-        pet = Pet(
-            name="Max",
-            species="Dog",
-            age=3
-        )
+        assert daily_pet.get_total_task_duration() == TOTAL_DAILY
+
+    def test_get_tasks_by_priority(self):
+        """Verify that daily tasks are grouped by priority and refresh after changes."""
+        pet = Pet("Max", "Dog", 3)
+        walk = make_task("Walk", 30)
+        play = make_task("Play", 20, "medium")
+        pet.add_task(walk)
+        pet.add_task(play)
+        pet.add_task(make_task("Bath", 45, "high", "weekly"))
+        
+        assert pet.get_tasks_by_priority("high") == [walk]
+        assert pet.get_tasks_by_priority("low") == []
+        
+        feed = make_task("Feed", 10)
+        pet.add_task(feed)
+        assert pet.get_tasks_by_priority("high") == [walk, feed]
+        assert pet.get_tasks_by_priority("medium") == [play]
+
+    def test_pets_have_unique_ids(self):
+        """Verify that pets with the same name still get distinct ids."""
+        first = Pet("Max", "Dog", 3)
+        second = Pet("Max", "Dog", 3)
+        
+        assert first.id != second.id
+        assert first == second
+
+    def test_get_task_by_name(self):
+        """Verify that daily tasks can be looked up by name, including after invalidate_cache."""
+        pet = Pet("Max", "Dog", 3)
+        walk = make_task("Walk", 30)
+        pet.add_task(walk)
+        pet.add_task(make_task("Walk", 45, "low", "weekly"))
+        pet.add_task(make_task("Walk", 20))
+        
+        assert pet.get_task_by_name("Walk") is walk
+        assert pet.get_task_by_name("Bath") is None
+        
+        feed = make_task("Feed", 10)
+        pet.tasks.append(feed)
+        walk.name = "Evening Walk"
+        pet.invalidate_cache()
+        
+        assert pet.get_task_by_name("Feed") is feed
+        assert pet.get_task_by_name("Evening Walk") is walk
+        assert pet.get_task_by_name("Walk").duration_minutes == 20
+
+    def test_remove_task(self):
+        """Verify that removing a task drops it from the list and the name index."""
+        pet = Pet("Max", "Dog", 3)
+        first = make_task("Feed", 10)
+        pet.add_task(first)
+        next_feed = first.mark_complete()
+        pet.add_task(next_feed)
+        
+        pet.remove_task(next_feed)
+        
+        assert pet.tasks == [first]
+        assert pet.get_task_by_name("Feed") is first
+        
+        pet.remove_task(first)
         
-        pet.add_task(Task("Walk", "Walking", 30, "high", "daily"))
-        pet.add_task(Task("Feed", "Feeding", 10, "high", "daily"))
-        pet.add_task(Task("Play", "Playing", 20, "medium", "daily"))
+        assert pet.tasks == []
+        assert pet.get_task_by_name("Feed") is None
+
+    def test_remove_task_by_identity(self):
+        """Verify that removing one of two equal tasks removes that exact instance."""
+        pet = Pet("Max", "Dog", 3)
+        created = datetime(2026, 1, 1, 8, 0)
+        first = make_task("Feed", 10, created_date=created)
+        second = make_task("Feed", 10, created_date=created)
+        pet.add_task(first)
+        pet.add_task(second)
+        
+        pet.remove_task(second)
         
-        assert pet.get_total_task_duration() == 60
+        assert len(pet.tasks) == 1
+        assert pet.tasks[0] is first
 
 
 class TestOwner:
     """Test cases for the Owner class."""
     
-    def test_add_pet(self):
+    def test_add_pet(self, owner, pet):
         """Verify that adding a pet increases the pet count."""
-        owner = Owner(name="Sarah")
-        
         assert len(owner.pets) == 0
         
-        pet = Pet("Max", "Dog", 3)
         owner.add_pet(pet)
         
-        assert len(owner.pets) == 1
-        assert owner.pets[0].name == "Max"
+        assert [p.name for p in owner.pets] == ["Max"]
 
-    def test_get_total_available_minutes(self):
+    def test_get_total_available_minutes(self, owner):
         """Verify that available minutes are calculated correctly."""
-        owner = Owner(
-            name="Sarah",
-            availability_start=time(8, 0),
-            availability_end=time(18, 0)
-        )
-        
-        # 8 AM to 6 PM = 10 hours = 600 minutes
-        assert owner.get_total_available_minutes() == 600
+        assert owner.get_total_available_minutes() == AVAILABLE_MINUTES
 
-    def test_get_all_daily_tasks(self):
+    def test_get_all_daily_tasks(self, owner, walk_task, feed_task, bath_task):
         """Verify that all daily tasks from all pets are retrieved."""
-        owner = Owner(name="Sarah")
-        
         dog = Pet("Max", "Dog", 3)
         cat = Pet("Whiskers", "Cat", 5)
         
-        dog.add_task(Task("Walk", "Walking", 30, "high", "daily"))
-        dog.add_task(Task("Feed", "Feeding", 10, "high", "daily"))
+        dog.add_task(walk_task)
+        dog.add_task(feed_task)
         
-        cat.add_task(Task("Feed", "Feeding", 10, "high", "daily"))
-        cat.add_task(Task("Bath", "Bathing", 45, "low", "weekly"))
+        cat.add_task(feed_task)
+        cat.add_task(bath_task)
         
         owner.add_pet(dog)
         owner.add_pet(cat)
@@ -211,17 +341,33 @@ class TestOwner:
         all_daily_tasks = owner.get_all_daily_tasks()
         assert len(all_daily_tasks) == 3  # 2 from dog + 1 from cat
 
-    def test_get_total_daily_task_minutes(self):
-        """Verify that total minutes across all pets are summed correctly."""
+    def test_get_all_daily_tasks_refreshes_after_changes(self):
+        """Verify that the owner's daily task list follows pet and task changes."""
         owner = Owner(name="Sarah")
+        dog = Pet("Max", "Dog", 3)
+        dog.add_task(make_task("Walk", 30))
+        owner.add_pet(dog)
+        assert len(owner.get_all_daily_tasks()) == 1
+        
+        cat = Pet("Whiskers", "Cat", 5)
+        owner.add_pet(cat)
+        cat.add_task(make_task("Feed", 10))
+        assert len(owner.get_all_daily_tasks()) == 2
+        assert owner.get_total_daily_task_minutes() == 40
         
+        owner.pets.remove(dog)
+        assert [t.name for t in owner.get_all_daily_tasks()] == ["Feed"]
+        assert owner.get_total_daily_task_minutes() == 10
+
+    def test_get_total_daily_task_minutes(self, owner, walk_task, feed_task):
+        """Verify that total minutes across all pets are summed correctly."""
         dog = Pet("Max", "Dog", 3)
         cat = Pet("Whiskers", "Cat", 5)
         
-        dog.add_task(Task("Walk", "Walking", 30, "high", "daily"))
-        dog.add_task(Task("Feed", "Feeding", 10, "high", "daily"))
+        dog.add_task(walk_task)
+        dog.add_task(feed_task)
         
-        cat.add_task(Task("Feed", "Feeding", 10, "high", "daily"))
+        cat.add_task(feed_task)
         
         owner.add_pet(dog)
         owner.add_pet(cat)
@@ -232,39 +378,45 @@ class TestOwner:
 class TestScheduler:
     """Test cases for the Scheduler class."""
     
-    def test_generate_schedule(self):
+    def test_generate_schedule(self, feasible_scheduler):
         """Verify that a schedule is generated with at least some tasks."""
-        owner = Owner("Sarah", time(8, 0), time(18, 0))
+        scheduler, schedule, _ = feasible_scheduler
+        
+        assert scheduler.schedule is schedule
+        # Same priority, so the shorter task goes first
+        assert [(s.task.name, s.scheduled_time) for s in schedule] == [
+            ("Feed", time(8, 0)),
+            ("Walk", time(8, 10)),
+        ]
+
+    def test_generate_schedule_fits_most_tasks_per_priority(self):
+        """Verify that short tasks are not crowded out by a long one of the same priority."""
+        owner = Owner("Sarah", time(8, 0), time(9, 0))
         pet = Pet("Max", "Dog", 3)
-        pet.add_task(Task("Walk", "Walking", 30, "high", "daily"))
-        pet.add_task(Task("Feed", "Feeding", 10, "high", "daily"))
+        pet.add_task(make_task("Long walk", 50))
+        pet.add_task(make_task("Feed", 10))
+        pet.add_task(make_task("Meds", 5))
+        pet.add_task(make_task("Brush", 5, "low"))
         owner.add_pet(pet)
         
-        scheduler = Scheduler(owner)
-        schedule = scheduler.generate_schedule()
+        schedule = Scheduler(owner).generate_schedule()
         
-        assert len(schedule) == 2
-        assert schedule[0].task.name == "Walk"
-        assert schedule[1].task.name == "Feed"
+        assert [s.task.name for s in schedule] == ["Meds", "Feed", "Brush"]
 
-    def test_is_schedule_feasible(self):
+    def test_is_schedule_feasible(self, feasible_scheduler):
         """Verify that feasibility is correctly evaluated."""
-        owner = Owner("Sarah", time(8, 0), time(18, 0))  # 10 hours = 600 minutes
-        pet = Pet("Max", "Dog", 3)
-        pet.add_task(Task("Walk", "Walking", 30, "high", "daily"))
-        owner.add_pet(pet)
+        # 40 high-priority minutes against 600 available
+        _, _, feasible = feasible_scheduler
         
-        scheduler = Scheduler(owner)
-        
-        assert scheduler.is_schedule_feasible() == True
+        assert feasible == True
 
     def test_schedule_not_feasible(self):
         """Verify that infeasible schedules are detected."""
         owner = Owner("Sarah", time(8, 0), time(9, 0))  # 1 hour = 60 minutes
         pet = Pet("Max", "Dog", 3)
         # Add multiple high-priority tasks that won't fit
-        pet.add_task(Task("Walk", "Walking", 45, "high", "daily"))
-        pet.add_task(Task("Feed", "Feeding", 30, "high", "daily"))
+        pet.add_task(make_task("Walk", 45))
+        pet.add_task(make_task("Feed", 30))
         owner.add_pet(pet)
         
         scheduler = Scheduler(owner)
@@ -281,9 +433,9 @@ class TestSorting:
         pet = Pet("Max", "Dog", 3)
         
         # Add tasks in random priority order
-        pet.add_task(Task("Low task", "Low priority", 10, "low", "daily"))
-        pet.add_task(Task("High task", "High priority", 20, "high", "daily"))
-        pet.add_task(Task("Medium task", "Medium priority", 15, "medium", "daily"))
+        pet.add_task(make_task("Low task", 10, "low"))
+        pet.add_task(make_task("High task", 20))
+        pet.add_task(make_task("Medium task", 15, "medium"))
         
         scheduler = Scheduler(owner)
         sorted_tasks = scheduler.sort_tasks_by_priority(pet.get_daily_tasks())
@@ -298,9 +450,9 @@ class TestSorting:
         pet = Pet("Max", "Dog", 3)
         
         # Add tasks with different durations
-        pet.add_task(Task("Task A", "30 min", 30, "medium", "daily"))
-        pet.add_task(Task("Task B", "10 min", 10, "medium", "daily"))
-        pet.add_task(Task("Task C", "20 min", 20, "medium", "daily"))
+        pet.add_task(make_task("Task A", 30, "medium"))
+        pet.add_task(make_task("Task B", 10, "medium"))
+        pet.add_task(make_task("Task C", 20, "medium"))
         
         scheduler = Scheduler(owner)
         sorted_tasks = scheduler.sort_tasks_by_duration(pet.get_daily_tasks(), ascending=True)
@@ -314,9 +466,9 @@ class TestSorting:
         owner = Owner("Test", time(8, 0), time(18, 0))
         pet = Pet("Max", "Dog", 3)
         
-        pet.add_task(Task("Task A", "30 min", 30, "medium", "daily"))
-        pet.add_task(Task("Task B", "10 min", 10, "medium", "daily"))
-        pet.add_task(Task("Task C", "20 min", 20, "medium", "daily"))
+        pet.add_task(make_task("Task A", 30, "medium"))
+        pet.add_task(make_task("Task B", 10, "medium"))
+        pet.add_task(make_task("Task C", 20, "medium"))
         
         scheduler = Scheduler(owner)
         sorted_tasks = scheduler.sort_tasks_by_duration(pet.get_daily_tasks(), ascending=False)
@@ -334,10 +486,10 @@ class TestFiltering:
         owner = Owner("Test", time(8, 0), time(18, 0))
         pet = Pet("Max", "Dog", 3)
         
-        pet.add_task(Task("Task 1", "High", 10, "high", "daily"))
-        pet.add_task(Task("Task 2", "Low", 10, "low", "daily"))
-        pet.add_task(Task("Task 3", "High", 10, "high", "daily"))
-        pet.add_task(Task("Task 4", "Medium", 10, "medium", "daily"))
+        pet.add_task(make_task("Task 1", 10))
+        pet.add_task(make_task("Task 2", 10, "low"))
+        pet.add_task(make_task("Task 3", 10))
+        pet.add_task(make_task("Task 4", 10, "medium"))
         
         scheduler = Scheduler(owner)
         all_tasks = pet.get_daily_tasks()
@@ -351,9 +503,9 @@ class TestFiltering:
         owner = Owner("Test", time(8, 0), time(18, 0))
         pet = Pet("Max", "Dog", 3)
         
-        task1 = Task("Done", "Completed", 10, "high", "daily")
-        task2 = Task("Pending", "Not done", 10, "high", "daily")
-        task3 = Task("Also done", "Completed", 10, "high", "daily")
+        task1 = make_task("Done", 10)
+        task2 = make_task("Pending", 10)
+        task3 = make_task("Also done", 10)
         
         task1.mark_complete()
         task3.mark_complete()
@@ -374,9 +526,9 @@ class TestFiltering:
         owner = Owner("Test", time(8, 0), time(18, 0))
         pet = Pet("Max", "Dog", 3)
         
-        task1 = Task("Done", "Completed", 10, "high", "daily")
-        task2 = Task("Pending", "Not done", 10, "high", "daily")
-        task3 = Task("Also pending", "Not done", 10, "high", "daily")
+        task1 = make_task("Done", 10)
+        task2 = make_task("Pending", 10)
+        task3 = make_task("Also pending", 10)
         
         task1.mark_complete()
         
@@ -395,9 +547,9 @@ class TestFiltering:
         """Verify that task search by name works correctly."""
         pet = Pet("Max", "Dog", 3)
         
-        pet.add_task(Task("Morning walk", "Outdoor walk", 30, "high", "daily"))
-        pet.add_task(Task("Evening walk", "Park time", 30, "high", "daily"))
-        pet.add_task(Task("Feeding", "Dry kibble", 10, "high", "daily"))
+        pet.add_task(make_task("Morning walk", 30, description="Outdoor walk"))
+        pet.add_task(make_task("Evening walk", 30, description="Park time"))
+        pet.add_task(make_task("Feeding", 10, description="Dry kibble"))
         
         results = pet.search_tasks("walk")
         
@@ -408,9 +560,9 @@ class TestFiltering:
         """Verify that task search by description works correctly."""
         pet = Pet("Max", "Dog", 3)
         
-        pet.add_task(Task("Task 1", "Exercise activity", 30, "high", "daily"))
-        pet.add_task(Task("Task 2", "Feeding activity", 10, "high", "daily"))
-        pet.add_task(Task("Task 3", "Play activity", 20, "high", "daily"))
+        pet.add_task(make_task("Task 1", 30, description="Exercise activity"))
+        pet.add_task(make_task("Task 2", 10, description="Feeding activity"))
+        pet.add_task(make_task("Task 3", 20, description="Play activity"))
         
         results = pet.search_tasks("activity")
         
@@ -420,8 +572,8 @@ class TestFiltering:
         """Verify that task search is case-insensitive."""
         pet = Pet("Max", "Dog", 3)
         
-        pet.add_task(Task("Morning Walk", "Outdoor time", 30, "high", "daily"))
-        pet.add_task(Task("Feeding", "Dry kibble", 10, "high", "daily"))
+        pet.add_task(make_task("Morning Walk", 30, description="Outdoor time"))
+        pet.add_task(make_task("Feeding", 10, description="Dry kibble"))
         
         results_lower = pet.search_tasks("walk")
         results_upper = pet.search_tasks("WALK")
@@ -429,13 +581,35 @@ class TestFiltering:
         
         assert len(results_lower) == len(results_upper) == len(results_mixed) == 1
 
+    def test_search_tasks_does_not_span_fields(self):
+        """Verify that a query must match within the name or the description."""
+        pet = Pet("Max", "Dog", 3)
+        pet.add_task(make_task("Walk", 30, description="Outdoor time"))
+        
+        assert pet.search_tasks("walkoutdoor") == []
+        assert len(pet.search_tasks("door")) == 1
+
+    def test_search_tasks_short_query_and_refresh(self):
+        """Verify that short queries match and new tasks are searchable."""
+        pet = Pet("Max", "Dog", 3)
+        walk = make_task("Walk", 30, description="Outdoor time")
+        pet.add_task(walk)
+        assert pet.search_tasks("wa") == [walk]
+        assert pet.search_tasks("park") == []
+        
+        park = make_task("Play", 20, "medium", description="Park visit")
+        pet.add_task(park)
+        
+        assert pet.search_tasks("park") == [park]
+        assert pet.search_tasks("") == [walk, park]
+
 
 class TestRecurringTasks:
     """Test cases for recurring task automation."""
     
     def test_mark_daily_task_creates_next_occurrence(self):
         """Verify that completing a daily task creates a new instance."""
-        task = Task("Daily Feed", "Morning feeding", 10, "high", "daily")
+        task = make_task("Daily Feed", 10)
         
         next_task = task.mark_complete()
         
@@ -444,10 +618,11 @@ class TestRecurringTasks:
         assert next_task.name == task.name
         assert next_task.is_completed == False
         assert next_task.frequency == "daily"
+        assert next_task is not task
 
     def test_mark_weekly_task_creates_next_occurrence(self):
         """Verify that completing a weekly task creates a new instance."""
-        task = Task("Weekly Bath", "Full bath", 45, "medium", "weekly")
+        task = make_task("Weekly Bath", 45, "medium", "weekly")
         
         next_task = task.mark_complete()
         
@@ -458,7 +633,7 @@ class TestRecurringTasks:
 
     def test_non_recurring_task_returns_none(self):
         """Verify that non-recurring tasks return None when completed."""
-        task = Task("One-time task", "Special task", 20, "high", "once")
+        task = make_task("One-time task", 20, "high", "once")
         
         next_task = task.mark_complete()
         
@@ -467,13 +642,7 @@ class TestRecurringTasks:
 
     def test_recurring_task_preserves_properties(self):
         """Verify that new recurring task instances preserve original properties."""
-        original = Task(
-            "Walk", 
-            "Morning walk in park", 
-            30, 
-            priority="high", 
-            frequency="daily"
-        )
+        original = make_task("Walk", 30, description="Morning walk in park")
         
         next_task = original.mark_complete()
         
@@ -486,7 +655,7 @@ class TestRecurringTasks:
     def test_adding_recurring_task_to_pet(self):
         """Verify that recurring task can be added to pet after completion."""
         pet = Pet("Max", "Dog", 3)
-        task = Task("Feed Max", "Daily feeding", 10, "high", "daily")
+        task = make_task("Feed Max", 10)
         
         pet.add_task(task)
         assert len(pet.tasks) == 1
@@ -507,8 +676,8 @@ class TestConflictDetection:
         owner = Owner("Test", time(8, 0), time(18, 0))
         pet = Pet("Max", "Dog", 3)
         
-        pet.add_task(Task("Task 1", "First", 30, "high", "daily"))
-        pet.add_task(Task("Task 2", "Second", 20, "high", "daily"))
+        pet.add_task(make_task("Task 1", 30))
+        pet.add_task(make_task("Task 2", 20))
         
         scheduler = Scheduler(owner)
         scheduler.generate_schedule()
@@ -520,8 +689,8 @@ class TestConflictDetection:
         """Verify that overlapping tasks are detected."""
         scheduler = Scheduler(Owner("Test", time(8, 0), time(18, 0)))
         
-        task1 = Task("Task A", "First task", 30, "high", "daily")
-        task2 = Task("Task B", "Second task", 30, "high", "daily")
+        task1 = make_task("Task A", 30)
+        task2 = make_task("Task B", 30)
         
         # Manually create overlapping schedule
         scheduler.schedule = [
@@ -536,8 +705,8 @@ class TestConflictDetection:
         """Verify that tasks at exact same time are detected."""
         scheduler = Scheduler(Owner("Test", time(8, 0), time(18, 0)))
         
-        task1 = Task("Task A", "First", 30, "high", "daily")
-        task2 = Task("Task B", "Second", 30, "high", "daily")
+        task1 = make_task("Task A", 30)
+        task2 = make_task("Task B", 30)
         
         # Both start at same time
         scheduler.schedule = [
@@ -552,8 +721,8 @@ class TestConflictDetection:
         """Verify that adjacent tasks (back-to-back) don't conflict."""
         scheduler = Scheduler(Owner("Test", time(8, 0), time(18, 0)))
         
-        task1 = Task("Task A", "First", 30, "high", "daily")
-        task2 = Task("Task B", "Second", 30, "high", "daily")
+        task1 = make_task("Task A", 30)
+        task2 = make_task("Task B", 30)
         
         # Task 1: 9:00-9:30, Task 2: 9:30-10:00 (no overlap)
         scheduler.schedule = [
@@ -564,12 +733,97 @@ class TestConflictDetection:
         conflicts = scheduler.detect_conflicts()
         assert len(conflicts) == 0
 
+    def test_detect_non_adjacent_overlaps(self):
+        """Verify that a long task conflicts with every task it spans, not just its neighbour."""
+        scheduler = Scheduler(Owner("Test", time(8, 0), time(18, 0)))
+        
+        long_task = make_task("Long", 120)
+        first = make_task("First", 15)
+        second = make_task("Second", 15)
+        
+        scheduler.schedule = [
+            ScheduledTask(first, time(9, 15), 15),
+            ScheduledTask(long_task, time(9, 0), 120),
+            ScheduledTask(second, time(10, 0), 15),
+        ]
+        
+        conflicts = scheduler.detect_conflicts()
+        assert list(conflicts) == ["First vs Long", "Long vs Second"]
+
+    def test_can_fit_task(self):
+        """Verify that a task fits only in free slots inside availability."""
+        scheduler = Scheduler(Owner("Test", time(8, 0), time(18, 0)))
+        scheduler.schedule = [
+            ScheduledTask(make_task("Walk", 60), time(9, 0), 60),
+            ScheduledTask(make_task("Feed", 15), time(11, 0), 15),
+        ]
+        task = make_task("Play", 30, "medium")
+        
+        assert scheduler.can_fit_task(task, time(10, 0)) == True
+        assert scheduler.can_fit_task(task, time(9, 45)) == False
+        assert scheduler.can_fit_task(task, time(10, 45)) == False
+        assert scheduler.can_fit_task(task, time(17, 45)) == False
+
+    def test_can_fit_task_after_add_scheduled_task(self):
+        """Verify that tasks added one at a time are seen by can_fit_task."""
+        scheduler = Scheduler(Owner("Test", time(8, 0), time(18, 0)))
+        task = make_task("Play", 30, "medium")
+        assert scheduler.can_fit_task(task, time(10, 0)) == True
+        
+        scheduler.add_scheduled_task(
+            ScheduledTask(make_task("Walk", 120), time(9, 0), 120)
+        )
+        scheduler.add_scheduled_task(
+            ScheduledTask(make_task("Feed", 15), time(8, 0), 15)
+        )
+        
+        assert len(scheduler.schedule) == 2
+        assert scheduler.can_fit_task(task, time(10, 0)) == False
+        assert scheduler.can_fit_task(task, time(8, 0)) == False
+        assert scheduler.can_fit_task(task, time(11, 0)) == True
+
+    def test_can_fit_task_after_schedule_append(self):
+        """Verify that tasks appended to the schedule list directly are seen by can_fit_task."""
+        scheduler = Scheduler(Owner("Test", time(8, 0), time(18, 0)))
+        task = make_task("Play", 30, "medium")
+        assert scheduler.can_fit_task(task, time(10, 0)) == True
+        
+        scheduler.schedule.append(ScheduledTask(make_task("Walk", 60), time(10, 0), 60))
+        
+        assert scheduler.can_fit_task(task, time(10, 0)) == False
+        assert scheduler.can_fit_task(task, time(11, 0)) == True
+
+    def test_can_fit_task_after_schedule_item_assignment(self):
+        """Verify that a schedule entry replaced in place is seen by can_fit_task."""
+        scheduler = Scheduler(Owner("Test", time(8, 0), time(18, 0)))
+        task = make_task("Play", 30, "medium")
+        scheduler.schedule.append(ScheduledTask(make_task("Walk", 60), time(8, 0), 60))
+        assert scheduler.can_fit_task(task, time(10, 0)) == True
+        
+        scheduler.schedule[0] = ScheduledTask(make_task("Walk", 60), time(10, 0), 60)
+        
+        assert scheduler.can_fit_task(task, time(10, 0)) == False
+        assert scheduler.can_fit_task(task, time(8, 0)) == True
+
+    def test_can_fit_task_after_schedule_pop_and_append(self):
+        """Verify that a schedule entry swapped by pop and append is seen by can_fit_task."""
+        scheduler = Scheduler(Owner("Test", time(8, 0), time(18, 0)))
+        task = make_task("Play", 30, "medium")
+        scheduler.schedule.append(ScheduledTask(make_task("Walk", 60), time(8, 0), 60))
+        assert scheduler.can_fit_task(task, time(10, 0)) == True
+        
+        scheduler.schedule.pop()
+        scheduler.schedule.append(ScheduledTask(make_task("Walk", 60), time(10, 0), 60))
+        
+        assert scheduler.can_fit_task(task, time(10, 0)) == False
+        assert scheduler.can_fit_task(task, time(8, 0)) == True
+
     def test_conflicts_summary_message(self):
         """Verify that conflict summary generates readable message."""
         scheduler = Scheduler(Owner("Test", time(8, 0), time(18, 0)))
         
-        task1 = Task("Walk", "Outdoor", 30, "high", "daily")
-        task2 = Task("Feed", "Food time", 30, "high", "daily")
+        task1 = make_task("Walk", 30)
+        task2 = make_task("Feed", 30)
         
         scheduler.schedule = [
             ScheduledTask(task1, time(10, 0), 30),
@@ -586,7 +840,7 @@ class TestConflictDetection:
         """Verify that no conflicts returns positive message."""
         scheduler = Scheduler(Owner("Test", time(8, 0), time(18, 0)))
         
-        task1 = Task("Task A", "First", 30, "high", "daily")
+        task1 = make_task("Task A", 30)
         scheduler.schedule = [ScheduledTask(task1, time(10, 0), 30)]
         
         summary = scheduler.get_conflicts_summary()
@@ -625,6 +879,14 @@ class TestAdvancedQuerying:
         assert found_upper is not None
         assert found_mixed is not None
 
+    def test_get_pet_by_name_casefold(self):
+        """Verify that pet lookup folds case beyond ASCII."""
+        owner = Owner("Test")
+        pet = Pet("Strauß", "Bird", 2)
+        owner.add_pet(pet)
+        
+        assert owner.get_pet_by_name("STRAUSS") is pet
+
     def test_get_pet_by_name_not_found(self):
         """Verify that searching for non-existent pet returns None."""
         owner = Owner("Test")
@@ -633,17 +895,33 @@ class TestAdvancedQuerying:
         not_found = owner.get_pet_by_name("Buddy")
         assert not_found is None
 
+    def test_get_pet_by_name_after_changes(self):
+        """Verify that lookups follow removed and renamed pets."""
+        owner = Owner("Test")
+        dog = Pet("Max", "Dog", 3)
+        cat = Pet("Whiskers", "Cat", 5)
+        owner.add_pet(dog)
+        owner.add_pet(cat)
+        assert owner.get_pet_by_name("max") is dog
+        
+        owner.remove_pet(dog)
+        assert owner.get_pet_by_name("max") is None
+        
+        cat.name = "Tom"
+        assert owner.get_pet_by_name("whiskers") is None
+        assert owner.get_pet_by_name("tom") is cat
+
     def test_get_high_priority_tasks_all_pets(self):
         """Verify that high-priority tasks are aggregated across all pets."""
         owner = Owner("Test")
         
         dog = Pet("Max", "Dog", 3)
-        dog.add_task(Task("Walk", "High task", 30, "high", "daily"))
-        dog.add_task(Task("Play", "Low task", 20, "low", "daily"))
+        dog.add_task(make_task("Walk", 30))
+        dog.add_task(make_task("Play", 20, "low"))
         
         cat = Pet("Whiskers", "Cat", 5)
-        cat.add_task(Task("Feed", "High task", 10, "high", "daily"))
-        cat.add_task(Task("Groom", "Medium task", 15, "medium", "daily"))
+        cat.add_task(make_task("Feed", 10))
+        cat.add_task(make_task("Groom", 15, "medium"))
         
         owner.add_pet(dog)
         owner.add_pet(cat)
@@ -660,11 +938,11 @@ class TestAdvancedQuerying:
         dog = Pet("Max", "Dog", 3)
         cat = Pet("Whiskers", "Cat", 5)
         
-        dog_task1 = Task("Walk", "Outdoor", 30, "high", "daily")
-        dog_task2 = Task("Feed", "Food", 10, "high", "daily")
+        dog_task1 = make_task("Walk", 30)
+        dog_task2 = make_task("Feed", 10)
         dog_task2.mark_complete()
         
-        cat_task1 = Task("Feed", "Food", 10, "high", "daily")
+        cat_task1 = make_task("Feed", 10)
         
         dog.add_task(dog_task1)
         dog.add_task(dog_task2)